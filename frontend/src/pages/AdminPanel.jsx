@@ -25,8 +25,17 @@ function AdminPanel() {
 
   const fetchUsers = async () => {
     try {
-      const response = await api.get('/admin/users');
-      setUsers(response.data);
+      // The endpoint is paginated; keep requesting pages until the server says there are no more
+      const allUsers = [];
+      let page = 1;
+      let hasMore = true;
+      while (hasMore) {
+        const response = await api.get('/admin/users', { params: { page, page_size: 200 } });
+        allUsers.push(...response.data.users);
+        hasMore = response.data.has_more && response.data.users.length > 0;
+        page += 1;
+      }
+      setUsers(allUsers);
     } catch (error) {
       console.error('Failed to fetch users:', error);
       toast.error('Failed to fetch users');
@@ -20,6 +20,9 @@ function Chat() {
   const [chats, setChats] = useState([]);
   const [selectedChat, setSelectedChat] = useState(null);
   const [messages, setMessages] = useState([]);
+  const [hasMoreMessages, setHasMoreMessages] = useState(false);
+  const [olderCursor, setOlderCursor] = useState(null);
+  const [loadingOlder, setLoadingOlder] = useState(false);
   const [newMessage, setNewMessage] = useState('');
   const [users, setUsers] = useState([]);
   const [showNewChat, setShowNewChat] = useState(false);
@@ -38,6 +41,9 @@ function Chat() {
   const [imageGallery, setImageGallery] = useState(null);
   
   const messagesEndRef = useRef(null);
+  const messagesContainerRef = useRef(null);
+  const activeChatIdRef = useRef(null);
+  const prependOffsetRef = useRef(null);
   const typingTimeoutRef = useRef(null);
 
   useEffect(() => {
@@ -117,6 +123,15 @@ function Chat() {
   };
 
   useEffect(() => {
+    // Keep the viewport on the same message after older history is prepended
+    if (prependOffsetRef.current !== null) {
+      const container = messagesContainerRef.current;
+      if (container) {
+        container.scrollTop = container.scrollHeight - prependOffsetRef.current;
+      }
+      prependOffsetRef.current = null;
+      return;
+    }
     scrollToBottom();
   }, [messages]);
 
@@ -141,14 +156,51 @@ function Chat() {
   };
 
   const fetchMessages = async (chatId) => {
+    activeChatIdRef.current = chatId;
+    setHasMoreMessages(false);
+    setOlderCursor(null);
     try {
       const response = await api.get(`/chats/${chatId}/messages`);
-      setMessages(response.data);
+      if (activeChatIdRef.current !== chatId) return;
+      setMessages(response.data.messages);
+      setHasMoreMessages(response.data.has_more);
+      setOlderCursor(response.data.before_cursor);
     } catch (error) {
       console.error('Failed to fetch messages:', error);
     }
   };
 
+  const loadOlderMessages = async () => {
+    const chatId = activeChatIdRef.current;
+    if (!chatId || !hasMoreMessages || !olderCursor || loadingOlder) return;
+
+    setLoadingOlder(true);
+    try {
+      const response = await api.get(`/chats/${chatId}/messages`, {
+        params: { before: olderCursor }
+      });
+      if (activeChatIdRef.current !== chatId) return;
+      const container = messagesContainerRef.current;
+      prependOffsetRef.current = container ? container.scrollHeight - container.scrollTop : null;
+      setMessages(prev => {
+        const seen = new Set(prev.map(m => m.id));
+        return [...response.data.messages.filter(m => !seen.has(m.id)), ...prev];
+      });
+      setHasMoreMessages(response.data.has_more);
+      setOlderCursor(response.data.before_cursor);
+    } catch (error) {
+      console.error('Failed to load older messages:', error);
+    } finally {
+      setLoadingOlder(false);
+    }
+  };
+
+  const handleMessagesScroll = (e) => {
+    if (e.currentTarget.scrollTop < 50) {
+      loadOlderMessages();
+    }
+  };
+
   const createChat = async () => {
     if (selectedUsers.length === 0) return;
 
@@ -496,7 +548,10 @@ function Chat() {
               </div>
 
               {/* Messages */}
-              <div className={`flex-1 overflow-y-auto p-6 space-y-4 ${darkMode ? 'bg-gradient-to-br from-primary-900 to-primary-800' : 'bg-gradient-to-br from-gray-50 to-gray-100'}`} data-testid="messages-container">
+              <div
+                ref={messagesContainerRef}
+                onScroll={handleMessagesScroll}
+                className={`flex-1 overflow-y-auto p-6 space-y-4 ${darkMode ? 'bg-gradient-to-br from-primary-900 to-primary-800' : 'bg-gradient-to-br from-gray-50 to-gray-100'}`} data-testid="messages-container">
                 {messages.length === 0 ? (
                   <div className="flex items-center justify-center h-full">
                     <div className="text-center">
@@ -507,6 +562,18 @@ function Chat() {
                   </div>
                 ) : (
                   <>
+                    {hasMoreMessages && (
+                      <div className="flex justify-center">
+                        <button
+                          onClick={loadOlderMessages}
+                          disabled={loadingOlder}
+                          className={`px-4 py-1 text-sm rounded-full ${darkMode ? 'bg-gray-800 text-gray-300 hover:bg-gray-700' : 'bg-white text-gray-600 hover:bg-gray-100'} disabled:opacity-50`}
+                          data-testid="load-older-messages"
+                        >
+                          {loadingOlder ? 'Loading...' : 'Load older messages'}
+                        </button>
+                      </div>
+                    )}
                     {messages.map((message) => {
                       // Get all images from message files for gallery
                       const messageImages = (message.files || []).filter(f => 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark for GET /api/chats participant hydration
+
+Seeds a throwaway database with increasing numbers of chats and counts the
+MongoDB commands issued while hydrating them. With batched hydration the
+round-trip count stays flat no matter how many chats the user is in.
+
+The benchmark drops its database between runs, so it ignores MONGO_URL and
+only runs against a database whose name ends in "_bench".
+
+Usage:
+    BENCH_MONGO_URL=mongodb://localhost:27017/enterprise_comms_bench python benchmark_chat_hydration.py
+"""
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+from pymongo import monitoring
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+# Never inherit the developer's MONGO_URL: every run drops the database
+os.environ["MONGO_URL"] = os.getenv("BENCH_MONGO_URL", "mongodb://localhost:27017/enterprise_comms_bench")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret-key-not-for-production")
+
+class CommandCounter(monitoring.CommandListener):
+    """Counts commands sent to the server"""
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+counter = CommandCounter()
+monitoring.register(counter)
+
+import server  # noqa: E402  (listener must be registered before the client is created)
+
+if not server.db.name.endswith("_bench"):
+    sys.exit(f"Refusing to run against database '{server.db.name}': its name must end in '_bench'")
+
+CHAT_COUNTS = [10, 50, 200]
+PARTICIPANTS_PER_CHAT = 10
+
+async def seed(chat_count: int) -> str:
+    """Create users, spaces, subspaces and chats for one run, return the viewer's id"""
+    await server.db.client.drop_database(server.db.name)
+
+    users = [{"id": str(uuid.uuid4()), "username": f"bench_{i}", "email": f"bench_{i}@company.com",
+              "full_name": f"Bench User {i}", "password": "x", "points": 0, "level": 1}
+             for i in range(PARTICIPANTS_PER_CHAT * 5)]
+    await server.users_collection.insert_many(users)
+    viewer_id = users[0]["id"]
+
+    space_id = str(uuid.uuid4())
+    subspace_id = str(uuid.uuid4())
+    await server.spaces_collection.insert_one({"id": space_id, "name": "Bench", "icon": "📁"})
+    await server.db["subspaces"].insert_one({"id": subspace_id, "space_id": space_id, "name": "Bench Sub", "icon": "📂"})
+
+    chats = []
+    for i in range(chat_count):
+        others = [u["id"] for u in users[1 + (i % 5) * 9:1 + (i % 5) * 9 + PARTICIPANTS_PER_CHAT - 1]]
+        chats.append({"id": str(uuid.uuid4()), "name": f"Chat {i}", "type": "group",
+                      "participants": [viewer_id] + others, "space_id": space_id, "subspace_id": subspace_id})
+    await server.chats_collection.insert_many(chats)
+    return viewer_id
+
+async def run():
+    print(f"{'chats':>8} {'round trips':>12} {'time (ms)':>10}")
+    for chat_count in CHAT_COUNTS:
+        viewer_id = await seed(chat_count)
+
+        counter.count = 0
+        started = time.perf_counter()
+        chats = await server.get_chats(current_user={"id": viewer_id})
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        assert len(chats) == chat_count
+        assert all(len(chat["participants_data"]) == PARTICIPANTS_PER_CHAT for chat in chats)
+        print(f"{chat_count:>8} {counter.count:>12} {elapsed_ms:>10.1f}")
+
+    await server.db.client.drop_database(server.db.name)
+
+if __name__ == "__main__":
+    asyncio.run(run())